@@ -4,7 +4,7 @@ OZDF (Ozone Data Format) - A human-readable format for LLM training data.
 This package provides functionality to read, write, and manipulate OZDF files.
 """
 
-from ozdf.io import open_corpus_readonly, open_corpus_readwrite, open_corpus_writeonly, open_document
+from ozdf.io import open_corpus_readonly, open_corpus_readwrite, open_corpus_writeonly, open_document, open_document_from_bytes
 from ozdf.models import Corpus, Document, DirectoryDocument, Block, ListBlock, ExternalListBlock, ListItem
 
 __all__ = [
@@ -12,6 +12,7 @@ __all__ = [
     'open_corpus_readwrite',
     'open_corpus_writeonly',
     'open_document',
+    'open_document_from_bytes',
     'Corpus',
     'Document',
     'DirectoryDocument',
@@ -5,21 +5,81 @@ This module provides the main entry points:
 - open_corpus_readonly: Load corpus without save capability
 - open_corpus_readwrite: Load and copy corpus with save capability
 - open_document: Single document access (no save capability)
+- open_document_from_bytes: Single document access from in-memory data
 """
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Iterator, Optional
 from ozdf.models import Corpus, Document
-from ozdf.parser import parse_document
+from ozdf.parser import _PARSE_WORKERS, parse_document, parse_document_from_string
 import os
+import stat
 
+# Filename suffix of simple documents
+_OZDF_SUFFIX = '.ozdf'
 
-def _open_corpus(corpus_path: Optional[str], save_path: Optional[str]) -> Corpus:
+# Marker files that identify a directory document
+_METADATA_NAME = '_metadata.ozdf'
+_WRITING_MARKER = '.ozdf_writing'
+
+
+def _has_document_marker(dir_path: str) -> bool:
+    """
+    Check whether a directory contains _metadata.ozdf or .ozdf_writing.
+
+    Documents at rest always have _metadata.ozdf, so that is probed first and
+    .ozdf_writing (only present after an interrupted save) is only probed when
+    it is missing. This costs a single stat per healthy directory document,
+    independent of how many .ozdp files the directory holds.
+
+    Args:
+        dir_path: Path to the candidate directory
+
+    Returns:
+        True if the directory is a (possibly corrupted) directory document
+    """
+    if os.path.exists(os.path.join(dir_path, _METADATA_NAME)):
+        return True
+    return os.path.exists(os.path.join(dir_path, _WRITING_MARKER))
+
+
+def _scan_document_entries(corpus_path: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the directory entries of all documents directly in a corpus directory.
+
+    Documents are .ozdf files and directories containing _metadata.ozdf or
+    .ozdf_writing. scandir entries cache the file type from the directory
+    read, so is_file()/is_dir() don't need an extra stat per entry.
+
+    Args:
+        corpus_path: Path to the corpus directory
+
+    Returns:
+        An iterator of DirEntry objects, in directory order
+    """
+    # Bind hot-loop lookups to locals
+    suffix = _OZDF_SUFFIX
+    has_document_marker = _has_document_marker
+    with os.scandir(corpus_path) as entries:
+        for entry in entries:
+            # Check if it's a .ozdf file (cheap name test before the type check)
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield entry
+            # Check if it's a directory document (contains _metadata.ozdf or .ozdf_writing)
+            elif entry.is_dir() and has_document_marker(entry.path):
+                yield entry
+
+
+def _open_corpus(corpus_path: Optional[str], save_path: Optional[str], lazy: bool = False) -> Corpus:
     """
     Internal function to open a corpus.
 
     Args:
         corpus_path: Path to the corpus directory to load (None for blank corpus)
         save_path: Path for saving (None for read-only)
+        lazy: If True, documents (and the .ozdp data parts of their external list
+            blocks) are parsed on first access instead of immediately
 
     Returns:
         A Corpus object
@@ -29,62 +89,68 @@ def _open_corpus(corpus_path: Optional[str], save_path: Optional[str]) -> Corpus
 
     # If corpus_path is provided, load documents
     if corpus_path is not None:
-        # Validate corpus_path exists and is a directory
-        if not os.path.exists(corpus_path):
-            raise FileNotFoundError(f"Corpus path does not exist: {corpus_path}")
-        if not os.path.isdir(corpus_path):
+        # Validate corpus_path exists and is a directory (one stat for both checks)
+        try:
+            corpus_stat = os.stat(corpus_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Corpus path does not exist: {corpus_path}") from None
+        if not stat.S_ISDIR(corpus_stat.st_mode):
             raise NotADirectoryError(f"Corpus path is not a directory: {corpus_path}")
 
-        # Find all .ozdf files and directory documents directly in corpus_path
-        document_paths = []
-        for item in os.listdir(corpus_path):
-            item_path = os.path.join(corpus_path, item)
-            # Check if it's a .ozdf file
-            if item.endswith('.ozdf') and os.path.isfile(item_path):
-                document_paths.append(item_path)
-            # Check if it's a directory document (contains _metadata.ozdf or .ozdf_writing)
-            elif os.path.isdir(item_path):
-                has_metadata = os.path.exists(os.path.join(item_path, '_metadata.ozdf'))
-                has_writing_marker = os.path.exists(os.path.join(item_path, '.ozdf_writing'))
-                if has_metadata or has_writing_marker:
-                    document_paths.append(item_path)
-
-        # Sort for consistent ordering
-        document_paths.sort()
-
-        # Parse and add each document to corpus
-        for file_path in document_paths:
-            document = parse_document(file_path)
-            corpus._add_existing_document(document)
+        if lazy:
+            # Sort for consistent ordering (all entries share the same base
+            # path, so sorting by name matches sorting full paths)
+            document_entries = sorted(_scan_document_entries(corpus_path), key=lambda entry: entry.name)
+            for entry in document_entries:
+                corpus._add_lazy_document(entry.name, partial(parse_document, entry.path, lazy=True))
+        else:
+            # Documents are independent and parsing is dominated by file reads,
+            # so each document is submitted to a thread pool as soon as the scan
+            # finds it. Parsing overlaps with the rest of the directory scan
+            # instead of waiting for the full listing. The documents already
+            # run in parallel, so their .ozdp files are parsed serially rather
+            # than each starting a nested pool.
+            with ThreadPoolExecutor(max_workers=_PARSE_WORKERS) as executor:
+                pending = [(entry.name, executor.submit(parse_document, entry.path, _parallel=False))
+                           for entry in _scan_document_entries(corpus_path)]
+
+            # Sort for consistent ordering, then add each document to corpus
+            pending.sort(key=lambda item: item[0])
+            for name, future in pending:
+                corpus._add_existing_document(future.result())
 
     # If save_path is provided, create directory and save all documents
     if save_path is not None:
-        # Validate save_path doesn't exist
-        if os.path.exists(save_path):
-            raise FileExistsError(f"Output path already exists: {save_path}")
-
-        # Create save_path directory
-        os.makedirs(save_path)
+        # Create save_path directory (makedirs itself fails if it already exists)
+        try:
+            os.makedirs(save_path)
+        except FileExistsError:
+            raise FileExistsError(f"Output path already exists: {save_path}") from None
 
         corpus.save()
 
     return corpus
 
 
-def open_corpus_readonly(corpus_path: str) -> Corpus:
+def open_corpus_readonly(corpus_path: str, lazy: bool = False) -> Corpus:
     """
     Open a corpus without save capability.
 
-    The entire corpus is loaded into memory immediately.
+    By default the entire corpus is loaded into memory immediately. With
+    lazy=True, only the list of documents is read up front and each document
+    is parsed the first time it is accessed (by iteration or get_document()).
+    The list items of external list blocks are likewise only parsed from
+    their .ozdp files when first accessed.
     Calling save() on this corpus will raise an exception.
 
     Args:
         corpus_path: Path to the corpus directory
+        lazy: If True, defer parsing each document until it is first accessed
 
     Returns:
         A Corpus object (acts as context manager)
     """
-    return _open_corpus(corpus_path, save_path=None)
+    return _open_corpus(corpus_path, save_path=None, lazy=lazy)
 
 
 def open_corpus_readwrite(input_path: str, output_path: str) -> Corpus:
@@ -120,16 +186,59 @@ def open_corpus_writeonly(save_path: str) -> Corpus:
     return _open_corpus(corpus_path=None, save_path=save_path)
 
 
-def open_document(document_path: str) -> Document:
+@lru_cache(maxsize=128)
+def _parse_document_cached(abs_path: str, mtime_ns: int, size: int) -> Document:
+    """
+    Parse a simple document, memoized on its path, modification time and size.
+
+    The mtime and size are part of the cache key so that a file changed on
+    disk is parsed again rather than served stale.
+    """
+    return parse_document(abs_path)
+
+
+def open_document(document_path: str, cached: bool = False, lazy: bool = False) -> Document:
     """
     Open a single document (no save capability).
 
-    The document is loaded into memory immediately.
+    The document is loaded into memory immediately. With lazy=True, the
+    list items of external list blocks are instead parsed from their .ozdp
+    files the first time each one is accessed; len() of the list block works
+    without parsing any of them.
+
+    With cached=True, repeated opens of an unchanged .ozdf file return the
+    same Document object instead of parsing the file again. The returned
+    document is shared between callers, so it must be treated as read-only.
+    Directory documents are never cached, since a change to one of their
+    .ozdp files isn't visible from the directory's own stat.
 
     Args:
         document_path: Path to the .ozdf file or document directory
+        cached: If True, reuse a previously parsed Document for an unchanged file
+        lazy: If True, defer parsing .ozdp data parts until their list items are accessed
+
+    Returns:
+        A Document object
+    """
+    if cached:
+        document_stat = os.stat(document_path)
+        if stat.S_ISREG(document_stat.st_mode):
+            return _parse_document_cached(os.path.abspath(document_path), document_stat.st_mtime_ns, document_stat.st_size)
+    return parse_document(document_path, lazy=lazy)
+
+
+def open_document_from_bytes(data: bytes, name: str = '<in-memory>') -> Document:
+    """
+    Open a single simple document from its UTF-8 encoded contents (no save capability).
+
+    No filesystem access is performed, which is useful for data that is
+    already in memory (archives, network sources, test fixtures).
+
+    Args:
+        data: The contents of a .ozdf file
+        name: The document filename (used for Document.filename and error messages)
 
     Returns:
         A Document object
     """
-    return parse_document(document_path)
+    return parse_document_from_string(data.decode('utf-8'), name)
@@ -12,14 +12,110 @@ This module contains the main data structures:
 import os
 import glob
 import shutil
-from typing import List, Optional, Iterator
-
-from ozdf.normalization import split_into_paragraphs, normalize_paragraphs, wrap_to_80_chars
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Iterator, Tuple
+
+from ozdf.normalization import split_and_normalize, normalize_paragraphs, write_wrapped
+
+
+# Thread pool size for writing .ozdp files (same default as ThreadPoolExecutor)
+_WRITE_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+# Flags for creating or truncating a file for writing. O_BINARY (Windows only)
+# stops the C runtime from translating newlines.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _write_text_file(payload: Tuple[str, str]):
+    """
+    Write a text file as UTF-8 with '\\n' line endings.
+
+    The text is encoded up front and written with os.write on a raw file
+    descriptor, so a file costs one open, usually one write, and one close,
+    without setting up a buffered text wrapper for it.
+
+    Args:
+        payload: Tuple of (file path, file contents)
+    """
+    file_path, text = payload
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+    try:
+        # os.write may write less than requested, so loop until everything is written
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _write_text_files(payloads: List[Tuple[str, str]], parallel: bool = True):
+    """
+    Write several text files with _write_text_file.
+
+    The files are independent, so with more than two of them the writes
+    overlap on a thread pool (file writes release the GIL). One or two files
+    are written directly, which is cheaper than starting a pool.
+
+    Args:
+        payloads: List of (file path, file contents) tuples
+        parallel: If False, always write serially (the caller is already
+            running on a thread pool, so a nested pool would only add threads)
+    """
+    if not parallel or len(payloads) <= 2:
+        for payload in payloads:
+            _write_text_file(payload)
+    else:
+        with ThreadPoolExecutor(max_workers=min(_WRITE_WORKERS, len(payloads))) as executor:
+            # Consume the results so that any write error is raised here
+            list(executor.map(_write_text_file, payloads))
+
+
+def _remove_document_directory(path: str):
+    """
+    Delete a directory that holds a superseded or unfinished copy of a directory document.
+
+    _metadata.ozdf is deleted before the rest, so a removal that is
+    interrupted or fails part-way never leaves behind a directory that loads
+    as a document. At most the .ozdf_writing marker survives, which is
+    reported as an incomplete save.
+
+    Args:
+        path: Path to the directory (nothing is done if it doesn't exist)
+    """
+    if not os.path.isdir(path):
+        return
+    try:
+        os.remove(os.path.join(path, '_metadata.ozdf'))
+    except FileNotFoundError:
+        pass
+    shutil.rmtree(path)
+
+
+def _data_part_text(list_item: 'ListItem') -> str:
+    """
+    Build the contents of the .ozdp data part file for a list item.
+
+    Args:
+        list_item: The list item of an external list block
+
+    Returns:
+        The file contents (optional NAME block, then DATA block)
+    """
+    # The whole file is one f-string (built in a single pass), with the NAME
+    # block only if the list item has a name and the DATA block always present
+    if list_item.name:
+        return f"#### NAME\n{list_item.name}\n\n#### DATA\n{list_item.get_text()}\n\n"
+    return f"#### DATA\n{list_item.get_text()}\n\n"
 
 
 class Block:
     """A simple text block containing one or more paragraphs."""
 
+    __slots__ = ('_name', '_paragraphs', '_raw_text', '_parent', '_normalized_paragraphs', '_dirty')
+
     def __init__(self, name: str, parent: 'Document'):
         """
         Initialize a Block.
@@ -28,13 +124,71 @@ class Block:
             name: The block name (will be converted to uppercase)
             parent: The parent Document
         """
-        self.name = name.upper()
-        self.paragraphs: List[str] = []
+        self._name = sys.intern(name.upper())  # Interned: shared across documents and used as a dict key
+        self._paragraphs: List[str] = []
+        self._raw_text: Optional[str] = None  # Text from the parser that hasn't been split into paragraphs yet
         self._parent = parent
+        self._normalized_paragraphs: Optional[List[str]] = None  # Copy of paragraphs as of the last normalization
+        self._dirty = True  # Changed since last saved (only tracked for .ozdp data parts)
 
-    def _mark_dirty(self):
-        """Mark this block's parent document as dirty."""
-        self._parent._mark_dirty()
+    @property
+    def name(self) -> str:
+        """The block name."""
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+
+    @property
+    def paragraphs(self) -> List[str]:
+        """
+        The list of paragraphs.
+
+        Text loaded by the parser is only split into paragraphs and normalized
+        here, the first time it is needed, so blocks that are never read or
+        modified cost no normalization.
+        """
+        if self._raw_text is not None:
+            self._paragraphs = split_and_normalize(self._raw_text)
+            self._normalized_paragraphs = list(self._paragraphs)
+            self._raw_text = None
+        return self._paragraphs
+
+    @paragraphs.setter
+    def paragraphs(self, paragraphs: List[str]):
+        self._paragraphs = paragraphs
+        self._raw_text = None
+        self._dirty = True
+
+    def _normalize(self):
+        """
+        Normalize paragraphs in place, skipping the work if they haven't changed since the last normalization.
+
+        The comparison against the saved copy is element-wise and short-circuits
+        on identical string objects, so unchanged paragraphs cost a pointer
+        comparison each. Comparing contents (rather than tracking mutations)
+        also catches direct edits to the paragraphs list.
+        """
+        if self.paragraphs != self._normalized_paragraphs:
+            self.paragraphs = normalize_paragraphs(self.paragraphs)
+            self._normalized_paragraphs = list(self.paragraphs)
+
+    def _is_unchanged_since_save(self, saved_paragraphs: List[str]) -> bool:
+        """
+        Check whether the content is the same as when the dirty flag was last cleared by a save.
+
+        Changes through the API set the dirty flag. Direct edits to the
+        paragraphs list don't, so the paragraphs are also compared against the
+        copy recorded when the block was saved.
+
+        Args:
+            saved_paragraphs: The paragraphs as written by the last save
+
+        Returns:
+            True if the saved copy of this block is still current
+        """
+        return not self._dirty and self._raw_text is None and self._paragraphs == saved_paragraphs
 
     def get_text(self) -> str:
         """Get the full text of the block with paragraphs separated by double newlines."""
@@ -50,19 +204,48 @@ class Block:
         Args:
             text: The text content to set
         """
-        paragraphs = split_into_paragraphs(text)
-        self.paragraphs = normalize_paragraphs(paragraphs)
-        self._mark_dirty()
+        self.paragraphs = split_and_normalize(text)
+        self._normalized_paragraphs = list(self.paragraphs)
+        self._parent._dirty = True  # Mark parent document as dirty
 
-    def set_paragraphs(self, paragraphs: List[str]):
+    def _set_raw_text(self, text: str):
+        """
+        Set the text content like set_text(), but defer splitting and normalizing it until first access.
+
+        Used by the parser, since many blocks of a loaded document are never read.
+
+        Args:
+            text: The text content to set
+        """
+        self._raw_text = text
+        self._dirty = True
+        self._parent._dirty = True  # Mark parent document as dirty
+
+    def _get_source_text(self) -> str:
+        """
+        Get text that gives this block's paragraphs when split and normalized.
+
+        Returns the raw text from the parser if it hasn't been processed yet,
+        which lets it be handed to another block without normalizing it here.
+
+        Returns:
+            The raw text, or get_text() if there is no pending raw text
+        """
+        if self._raw_text is not None:
+            return self._raw_text
+        return self.get_text()
+
+    def set_paragraphs(self, paragraphs: List[str], *, copy: bool = True):
         """
         Set the paragraphs directly from a list.
 
         Args:
             paragraphs: List of paragraph strings
+            copy: If False, take ownership of the given list instead of copying it.
+                Only pass False for a list that the caller won't use afterwards.
         """
-        self.paragraphs = list(paragraphs)  # Make a copy
-        self._mark_dirty()
+        self.paragraphs = list(paragraphs) if copy else paragraphs
+        self._parent._dirty = True  # Mark parent document as dirty
 
     def __iter__(self) -> Iterator[str]:
         """Iterate over paragraphs."""
@@ -79,12 +262,14 @@ class Block:
     def __setitem__(self, index: int, value: str):
         """Set a paragraph by index."""
         self.paragraphs[index] = value
-        self._mark_dirty()
+        self._dirty = True
+        self._parent._dirty = True  # Mark parent document as dirty
 
     def append(self, paragraph: str):
         """Add a paragraph to the end of the block."""
         self.paragraphs.append(paragraph)
-        self._mark_dirty()
+        self._dirty = True
+        self._parent._dirty = True  # Mark parent document as dirty
 
     def _serialize_to(self, file):
         """
@@ -93,27 +278,40 @@ class Block:
         Args:
             file: A file-like object opened for writing
         """
+        parts: List[str] = []
+        self._serialize_into(parts)
+        file.write("".join(parts))
+
+    def _serialize_into(self, parts: List[str]):
+        """
+        Append the serialized form of this block to a list of strings. Also normalizes paragraphs.
+
+        Args:
+            parts: List that the serialized text pieces are appended to
+        """
         # Normalize paragraphs first
-        self.paragraphs = normalize_paragraphs(self.paragraphs)
+        self._normalize()
 
         # Write block header
-        file.write(f"#### {self.name}\n")
+        parts.append(f"#### {self.name}\n")
 
         # Write each paragraph separated by blank lines
-        for i, paragraph in enumerate(self.paragraphs):
-            wrapped = wrap_to_80_chars(paragraph)
-            file.write(wrapped)
-            file.write("\n\n")
+        append = parts.append
+        for paragraph in self.paragraphs:
+            write_wrapped(paragraph, append)
+            append("\n\n")
 
         # Add required double newline if one wasn't added by writing the paragraphs
         if not self.paragraphs:
-            file.write("\n\n")
+            parts.append("\n\n")
 
 
 # Note: Comment type is excluded from cheatsheet
 class Comment:
     """A comment block that stores raw text without normalization."""
 
+    __slots__ = ('text',)
+
     def __init__(self):
         """
         Initialize a Comment.
@@ -134,6 +332,9 @@ class Comment:
         """
         self.text = text
 
+    # Comments store raw text anyway, so the parser's deferred setter is the same
+    _set_raw_text = set_text
+
     def _serialize_to(self, file):
         """
         Serialize this comment to a file.
@@ -141,19 +342,32 @@ class Comment:
         Args:
             file: A file-like object opened for writing
         """
+        parts: List[str] = []
+        self._serialize_into(parts)
+        file.write("".join(parts))
+
+    def _serialize_into(self, parts: List[str]):
+        """
+        Append the serialized form of this comment to a list of strings.
+
+        Args:
+            parts: List that the serialized text pieces are appended to
+        """
         # Write comment header
-        file.write("#### COMMENT\n")
+        parts.append("#### COMMENT\n")
 
         # Write raw text as-is
-        file.write(self.text)
+        parts.append(self.text)
 
         # Add newline that got lost when building self.text
-        file.write("\n")
+        parts.append("\n")
 
 
 class ListItem(Block):
     """A list item containing one or more paragraphs. Supports indexing and iteration."""
 
+    __slots__ = ()
+
     def __init__(self, name: Optional[str], parent: 'Document'):
         """
         Initialize a ListItem.
@@ -163,10 +377,27 @@ class ListItem(Block):
             parent: The parent Document
         """
         # Don't call super().__init__() because Block uppercases the name
-        # Instead, directly set the name, paragraphs, and parent
-        self.name = name
-        self.paragraphs: List[str] = []
+        # Instead, directly set the name, paragraphs, parent, and normalization state
+        # Interned, since item names such as speakers repeat across items and
+        # documents (sys.intern only accepts exact str, so None and str subclasses are kept as is)
+        self._name = sys.intern(name) if type(name) is str else name
+        self._paragraphs: List[str] = []
+        self._raw_text: Optional[str] = None
         self._parent = parent
+        self._normalized_paragraphs: Optional[List[str]] = None
+        self._dirty = True
+
+    @property
+    def name(self) -> Optional[str]:
+        """The list item name, or None if unnamed."""
+        return self._name
+
+    @name.setter
+    def name(self, name: Optional[str]):
+        # The name is saved in the item's .ozdp file, so renaming changes the item
+        self._name = sys.intern(name) if type(name) is str else name
+        self._dirty = True
+        self._parent._dirty = True  # Mark parent document as dirty
 
     def get_name(self) -> Optional[str]:
         """
@@ -177,36 +408,38 @@ class ListItem(Block):
         """
         return self.name
 
-    def _serialize_to(self, file):
+    def _serialize_into(self, parts: List[str]):
         """
-        Serialize this list item to a file. Also normalizes paragraphs.
+        Append the serialized form of this list item to a list of strings. Also normalizes paragraphs.
 
         Args:
-            file: A file-like object opened for writing
+            parts: List that the serialized text pieces are appended to
         """
         # Normalize paragraphs first
-        self.paragraphs = normalize_paragraphs(self.paragraphs)
+        self._normalize()
 
         # Write list item header
         if self.name:
-            file.write(f"==== {self.name}\n")
+            parts.append(f"==== {self.name}\n")
         else:
-            file.write("====\n")
+            parts.append("====\n")
 
         # Write each paragraph separated by blank lines
-        for i, paragraph in enumerate(self.paragraphs):
-            wrapped = wrap_to_80_chars(paragraph)
-            file.write(wrapped)
-            file.write("\n\n")
+        append = parts.append
+        for paragraph in self.paragraphs:
+            write_wrapped(paragraph, append)
+            append("\n\n")
 
         # Add required double newline if one wasn't added by writing the paragraphs
         if not self.paragraphs:
-            file.write("\n\n")
+            parts.append("\n\n")
 
 
 class ListBlock:
     """A list block containing one or more list items."""
 
+    __slots__ = ('name', '_items', '_parent')
+
     def __init__(self, name: str, parent: 'Document'):
         """
         Initialize a ListBlock.
@@ -215,13 +448,18 @@ class ListBlock:
             name: The list block name (will be converted to uppercase)
             parent: The parent Document
         """
-        self.name = name.upper()
-        self.items: List[ListItem] = []
+        self.name = sys.intern(name.upper())  # Interned: shared across documents and used as a dict key
+        self._items: List[ListItem] = []
         self._parent = parent
 
-    def _mark_dirty(self):
-        """Mark this list block's parent document as dirty."""
-        self._parent._mark_dirty()
+    @property
+    def items(self) -> List[ListItem]:
+        """The list of list items."""
+        return self._items
+
+    @items.setter
+    def items(self, items: List[ListItem]):
+        self._items = items
 
     def is_external(self) -> bool:
         """
@@ -246,10 +484,34 @@ class ListBlock:
         list_item = ListItem(name, parent=self._parent)
         if content:
             list_item.set_text(content)
-        self.items.append(list_item)
-        self._mark_dirty()
+        self._items.append(list_item)
+        self._parent._dirty = True  # Mark parent document as dirty
         return list_item
 
+    def add_list_items(self, items: Iterable[Tuple[Optional[str], str]]) -> List[ListItem]:
+        """
+        Add several list items to the end of this list block at once.
+
+        Equivalent to calling add_list_item() for each (name, content) pair,
+        but the items are appended to the list in a single extend.
+
+        Args:
+            items: An iterable of (name, content) tuples; name may be None
+
+        Returns:
+            The newly created ListItem objects, in order
+        """
+        parent = self._parent
+        new_items: List[ListItem] = []
+        for name, content in items:
+            list_item = ListItem(name, parent=parent)
+            if content:
+                list_item.set_text(content)
+            new_items.append(list_item)
+        self._items.extend(new_items)
+        parent._dirty = True  # Mark parent document as dirty
+        return new_items
+
     def set_list_items(self, items):
         """
         Set the list items from an iterable.
@@ -263,12 +525,12 @@ class ListBlock:
         items_list = list(items)  # Make a copy
 
         # Validate that each item's parent is our parent document
-        for item in items_list:
-            if item._parent is not self._parent:
-                raise ValueError(f"List item parent mismatch: expected parent document, but item has different parent")
+        parent = self._parent
+        if any(item._parent is not parent for item in items_list):
+            raise ValueError(f"List item parent mismatch: expected parent document, but item has different parent")
 
         self.items = items_list
-        self._mark_dirty()
+        self._parent._dirty = True  # Mark parent document as dirty
 
     def __iter__(self) -> Iterator[ListItem]:
         """Iterate over list items."""
@@ -276,7 +538,7 @@ class ListBlock:
 
     def __len__(self) -> int:
         """Return the number of list items."""
-        return len(self.items)
+        return len(self._items)
 
     def __getitem__(self, index: int) -> ListItem:
         """Get a list item by index."""
@@ -289,17 +551,30 @@ class ListBlock:
         Args:
             file: A file-like object opened for writing
         """
+        parts: List[str] = []
+        self._serialize_into(parts)
+        file.write("".join(parts))
+
+    def _serialize_into(self, parts: List[str]):
+        """
+        Append the serialized form of this list block to a list of strings.
+
+        Args:
+            parts: List that the serialized text pieces are appended to
+        """
         # Write list block header
-        file.write(f"#### [{self.name}]\n")
+        parts.append(f"#### [{self.name}]\n")
 
         # Write each list item
         for item in self.items:
-            item._serialize_to(file)
+            item._serialize_into(parts)
 
 
 class ExternalListBlock(ListBlock):
     """An external list block for directory documents. Items are populated from .ozdp files."""
 
+    __slots__ = ('_data_part_name', '_saved_files', '_pending_items', '_item_loader')
+
     def __init__(self, name: str, parent: 'Document'):
         """
         Initialize an ExternalListBlock.
@@ -309,6 +584,77 @@ class ExternalListBlock(ListBlock):
             parent: The parent Document
         """
         super().__init__(name, parent)
+        # Name used in .ozdp filenames (uppercase, spaces → underscores). The
+        # name is already uppercased, so only the spaces need replacing, and
+        # it is computed once since block names never change.
+        self._data_part_name = self.name.replace(' ', '_')
+        # Maps each list item to its .ozdp filename and the paragraphs written
+        # there, as of the last completed save
+        self._saved_files: Dict[ListItem, Tuple[str, List[str]]] = {}
+        # Lazily loaded items: maps index to .ozdp path (the item slot holds None until loaded)
+        self._pending_items: Dict[int, str] = {}
+        self._item_loader: Optional[Callable[[List[str]], List[ListItem]]] = None
+
+    def _add_lazy_items(self, file_paths: List[str], loader: Callable[[List[str]], List[ListItem]]):
+        """
+        Internal method to add list items that are only loaded from their .ozdp files on first access.
+
+        Args:
+            file_paths: Paths of the .ozdp files, in item order
+            loader: Callable that parses a list of .ozdp paths into ListItems, in the same order
+        """
+        start = len(self._items)
+        self._items.extend([None] * len(file_paths))
+        for offset, file_path in enumerate(file_paths):
+            self._pending_items[start + offset] = file_path
+        self._item_loader = loader
+
+    def _load_items(self, indexes: List[int]):
+        """
+        Internal method to load pending list items.
+
+        Loading doesn't mark the document dirty, since the items are unchanged
+        from what is on disk.
+
+        Args:
+            indexes: Indexes of pending items to load
+        """
+        document = self._parent
+        was_dirty = document._dirty
+        loaded_items = self._item_loader([self._pending_items[index] for index in indexes])
+        document._dirty = was_dirty
+
+        # Only forget the paths once loading succeeded, so a failed load can be retried
+        for index, list_item in zip(indexes, loaded_items):
+            self._items[index] = list_item
+            del self._pending_items[index]
+
+    @property
+    def items(self) -> List[ListItem]:
+        """The list of list items (loads any items not loaded yet)."""
+        if self._pending_items:
+            self._load_items(sorted(self._pending_items))
+        return self._items
+
+    @items.setter
+    def items(self, items: List[ListItem]):
+        self._pending_items = {}
+        self._items = items
+
+    def __iter__(self) -> Iterator[ListItem]:
+        """Iterate over list items, loading any not yet loaded items as they are reached."""
+        if not self._pending_items:
+            return iter(self._items)
+        return (self[index] for index in range(len(self._items)))
+
+    def __getitem__(self, index: int) -> ListItem:
+        """Get a list item by index, loading only that item if it isn't loaded yet."""
+        if self._pending_items and isinstance(index, int):
+            position = index + len(self._items) if index < 0 else index
+            if position in self._pending_items:
+                self._load_items([position])
+            return self._items[index]
+        return self.items[index]
 
     def is_external(self) -> bool:
         """
@@ -319,62 +665,89 @@ class ExternalListBlock(ListBlock):
         """
         return True
 
-    def _serialize_to(self, file):
+    def _serialize_into(self, parts: List[str]):
         """
-        Serialize this external list block to a file (writes just the header, not items).
+        Append the serialized form of this external list block (just the header, not items) to a list of strings.
 
         Args:
-            file: A file-like object opened for writing
+            parts: List that the serialized text pieces are appended to
         """
-        # Write external list block header
-        file.write(f"#### [[{self.name}]]\n")
+        # Write external list block header, followed by a trailing blank line
+        parts.append(f"#### [[{self.name}]]\n\n")
 
-        # Write trailing blank line
-        file.write("\n")
-
-    def _save_data_parts_to(self, directory: str):
+    def _prepare_data_parts(self, directory: str, payloads: List[Tuple[str, str]],
+                            previous_directory: Optional[str] = None) -> Dict[ListItem, Tuple[str, List[str]]]:
         """
-        Save all list items as individual .ozdp files in the specified directory.
+        Prepare saving all list items as individual .ozdp files in the specified directory.
+
+        The (path, contents) of each file to write is appended to payloads, so
+        the caller can write the files of all blocks together.
+
+        If previous_directory holds this block's files from the last save,
+        items that haven't changed since then are hard-linked from there here
+        instead of being serialized and written again (this also covers items
+        that only moved to a different index). The previous directory itself is
+        not modified. Items that can't be linked are added to payloads.
 
         Args:
             directory: The directory path where .ozdp files should be saved
-        """
-        # Normalize the list block name for filenames (uppercase, spaces → underscores)
-        normalized_name = self.name.upper().replace(' ', '_')
+            payloads: List that (file path, file contents) tuples are appended to
+            previous_directory: The directory this document was last saved to, if any
 
+        Returns:
+            Mapping of each list item to the .ozdp filename written for it and the paragraphs it holds
+        """
         # Note: .ozdp files must be removed by the caller before calling this method
 
         # If no items, we're done
         if not self.items:
-            return
+            return {}
 
         # Calculate index padding (number of digits needed based on total items)
         num_items = len(self.items)
         padding = max(2, len(str(num_items)))  # At least 2 digits
 
-        # Save each list item as a separate .ozdp file
+        # Formatter for the data part filenames. The name and padding are baked
+        # into the format string once, so the per-item call doesn't re-parse a
+        # nested format spec.
+        escaped_name = self._data_part_name.replace('{', '{{').replace('}', '}}')
+        format_file_name = f"{escaped_name}-{{:0{padding}d}}.ozdp".format
+        directory_prefix = os.path.join(directory, '')
+
+        # Build the contents of every changed .ozdp file
+        saved_files: Dict[ListItem, Tuple[str, List[str]]] = {}
+        links: List[Tuple[str, str, ListItem]] = []
+        previous_files = self._saved_files if previous_directory is not None else {}
         for index, list_item in enumerate(self.items, start=1):
-            # Create filename with padded index
-            padded_index = str(index).zfill(padding)
-            filename = f"{normalized_name}-{padded_index}.ozdp"
-            file_path = os.path.join(directory, filename)
-
-            # Write the .ozdp file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                # Write NAME block if the list item has a name
-                if list_item.name:
-                    f.write("#### NAME\n")
-                    f.write(f"{list_item.name}\n")
-                    f.write("\n")
-
-                # Write DATA block (always present)
-                f.write("#### DATA\n")
-                f.write(f"{list_item.get_text()}\n")
-                f.write("\n")
+            # Create file path with padded index
+            file_name = format_file_name(index)
+            file_path = directory_prefix + file_name
+
+            previous_file = previous_files.get(list_item)
+            if previous_file is not None and list_item._is_unchanged_since_save(previous_file[1]):
+                links.append((os.path.join(previous_directory, previous_file[0]), file_path, list_item))
+                saved_files[list_item] = (file_name, previous_file[1])
+            else:
+                payloads.append((file_path, _data_part_text(list_item)))
+                saved_files[list_item] = (file_name, list(list_item._paragraphs))
+
+        # Reuse unchanged files. Linking leaves the previous directory intact,
+        # so an interrupted save still finds it complete.
+        for source_path, file_path, list_item in links:
+            try:
+                os.link(source_path, file_path)
+            except OSError:
+                # No hard link support, or the file was removed - write it instead
+                payloads.append((file_path, _data_part_text(list_item)))
+
+        return saved_files
+
 
 class Document:
     """A document containing blocks and list blocks."""
 
+    __slots__ = ('filename', '_blocks', '_list_blocks', '_ordered_elements', '_dirty', '_saved_directory')
+
     def __init__(self, file_path: str):
         """
         Initialize a Document.
@@ -385,13 +758,29 @@ class Document:
         self.filename = os.path.basename(file_path)
         self._blocks: dict = {}  # Maps uppercase block names to Block objects
         self._list_blocks: dict = {}  # Maps uppercase list block names to ListBlock objects
-        self._ordered_elements: List = []  # Track order of all elements (blocks, list blocks, comments)
+        # Track order of all elements (blocks, list blocks, comments), keyed by id(element)
+        # so that removal is O(1) instead of a list scan
+        self._ordered_elements: OrderedDict = OrderedDict()
         self._dirty = True
+        self._saved_directory: Optional[str] = None  # Absolute path of the directory last saved to
 
     def _mark_dirty(self):
         """Mark this document as dirty (modified)."""
         self._dirty = True
 
+    def _insert_element(self, element, position: int):
+        """
+        Internal method to add an element to the document order.
+
+        Args:
+            element: The Block, ListBlock, or Comment to add
+            position: 0 to insert at the beginning, -1 to append at the end
+        """
+        key = id(element)
+        self._ordered_elements[key] = element
+        if position == 0:
+            self._ordered_elements.move_to_end(key, last=False)
+
     def get_block(self, name: str) -> Block:
         """
         Get a block by name (case-insensitive).
@@ -405,10 +794,10 @@ class Document:
         Raises:
             KeyError: If block with the given name does not exist
         """
-        upper_name = name.upper()
-        if upper_name not in self._blocks:
+        block = self._blocks.get(name.upper())
+        if block is None:
             raise KeyError(f"Block '{name}' not found in document '{self.filename}'")
-        return self._blocks[upper_name]
+        return block
 
     def get_list_block(self, name: str) -> ListBlock:
         """
@@ -423,10 +812,10 @@ class Document:
         Raises:
             KeyError: If list block with the given name does not exist
         """
-        upper_name = name.upper()
-        if upper_name not in self._list_blocks:
+        list_block = self._list_blocks.get(name.upper())
+        if list_block is None:
             raise KeyError(f"List block '{name}' not found in document '{self.filename}'")
-        return self._list_blocks[upper_name]
+        return list_block
 
     def _add_block(self, name: str, content: str, position: int) -> Block:
         """
@@ -443,8 +832,9 @@ class Document:
         Raises:
             ValueError: If a block with this name already exists
         """
-        # Convert name to uppercase for storage (case-insensitive lookups)
-        upper_name = name.upper()
+        # Convert name to uppercase for storage (case-insensitive lookups). The key
+        # is interned so it is the same object as the new element's name.
+        upper_name = sys.intern(name.upper())
 
         # Check if block already exists
         if upper_name in self._blocks:
@@ -461,10 +851,7 @@ class Document:
         self._blocks[upper_name] = block
 
         # Add to order tracking at specified position
-        if position == -1:
-            self._ordered_elements.append(block)
-        else:
-            self._ordered_elements.insert(position, block)
+        self._insert_element(block, position)
 
         # Mark document as dirty
         self._mark_dirty()
@@ -507,21 +894,15 @@ class Document:
         Raises:
             KeyError: If block with the given name does not exist
         """
-        # Convert name to uppercase for lookup
-        upper_name = name.upper()
+        # Remove from blocks dict (name converted to uppercase for lookup)
+        block = self._blocks.pop(name.upper(), None)
 
-        # Check if block exists
-        if upper_name not in self._blocks:
+        # Check if block existed
+        if block is None:
             raise KeyError(f"Block '{name}' not found in document '{self.filename}'")
 
-        # Get the block object
-        block = self._blocks[upper_name]
-
-        # Remove from blocks dict
-        del self._blocks[upper_name]
-
         # Remove from ordered elements
-        self._ordered_elements.remove(block)
+        del self._ordered_elements[id(block)]
 
         # Mark document as dirty
         self._mark_dirty()
@@ -540,8 +921,9 @@ class Document:
         Raises:
             ValueError: If a list block with this name already exists
         """
-        # Convert name to uppercase for storage (case-insensitive lookups)
-        upper_name = name.upper()
+        # Convert name to uppercase for storage (case-insensitive lookups). The key
+        # is interned so it is the same object as the new element's name.
+        upper_name = sys.intern(name.upper())
 
         # Check if list block already exists
         if upper_name in self._list_blocks:
@@ -554,10 +936,7 @@ class Document:
         self._list_blocks[upper_name] = list_block
 
         # Add to order tracking at specified position
-        if position == -1:
-            self._ordered_elements.append(list_block)
-        else:
-            self._ordered_elements.insert(position, list_block)
+        self._insert_element(list_block, position)
 
         # Mark document as dirty
         self._mark_dirty()
@@ -598,21 +977,15 @@ class Document:
         Raises:
             KeyError: If list block with the given name does not exist
         """
-        # Convert name to uppercase for lookup
-        upper_name = name.upper()
+        # Remove from list blocks dict (name converted to uppercase for lookup)
+        list_block = self._list_blocks.pop(name.upper(), None)
 
-        # Check if list block exists
-        if upper_name not in self._list_blocks:
+        # Check if list block existed
+        if list_block is None:
             raise KeyError(f"List block '{name}' not found in document '{self.filename}'")
 
-        # Get the list block object
-        list_block = self._list_blocks[upper_name]
-
-        # Remove from list blocks dict
-        del self._list_blocks[upper_name]
-
         # Remove from ordered elements
-        self._ordered_elements.remove(list_block)
+        del self._ordered_elements[id(list_block)]
 
         # Mark document as dirty
         self._mark_dirty()
@@ -625,21 +998,28 @@ class Document:
             The newly created Comment object
         """
         comment = Comment()
-        self._ordered_elements.append(comment)
+        self._insert_element(comment, -1)
         self._mark_dirty()
         return comment
 
-    def save_to(self, directory: str):
+    def save_to(self, directory: str, _parallel: bool = True):
         """
         Save this document to a directory using its filename.
 
         Uses atomic write pattern: writes to .tmp file first, then moves to final location.
+        Does nothing if the document is not dirty and was last saved to the same directory.
 
         Note: Does not clear the dirty flag - that is the caller's responsibility.
 
         Args:
             directory: The directory where the document should be saved
+            _parallel: Internal. If False, write the document's files serially
+                (for callers that already save several documents on a thread pool)
         """
+        # Nothing to do if the document is unchanged since it was last saved here
+        if self._is_saved_in(directory):
+            return
+
         # Ensure directory exists
         os.makedirs(directory, exist_ok=True)
 
@@ -647,13 +1027,38 @@ class Document:
         file_path = os.path.join(directory, self.filename)
         temp_path = file_path + '.tmp'
 
-        # Write to temporary file first
-        with open(temp_path, 'w') as f:
-            for element in self._ordered_elements:
-                element._serialize_to(f)
+        # Write to temporary file first (UTF-8 with '\n' line endings on every platform)
+        _write_text_file((temp_path, self._serialize()))
 
         # Atomically move temp file to final location (potentially overwriting)
         os.replace(temp_path, file_path)
+        self._saved_directory = os.path.abspath(directory)
+
+    def _serialize(self) -> str:
+        """
+        Serialize all elements of this document, in order, into one string.
+
+        For directory documents this is the contents of _metadata.ozdf.
+
+        Returns:
+            The serialized document text
+        """
+        parts: List[str] = []
+        for element in self._ordered_elements.values():
+            element._serialize_into(parts)
+        return "".join(parts)
+
+    def _is_saved_in(self, directory: str) -> bool:
+        """
+        Check whether this document is unchanged since it was last saved to a directory.
+
+        Args:
+            directory: The directory to check
+
+        Returns:
+            True if the document is not dirty and was last saved to this directory
+        """
+        return not self._dirty and self._saved_directory == os.path.abspath(directory)
 
     def is_directory(self) -> bool:
         """
@@ -668,6 +1073,8 @@ class Document:
 class DirectoryDocument(Document):
     """A directory document with _metadata.ozdf and .ozdp data part files."""
 
+    __slots__ = ()
+
     def __init__(self, file_path: str):
         """
         Initialize a DirectoryDocument.
@@ -700,8 +1107,9 @@ class DirectoryDocument(Document):
         Raises:
             ValueError: If a list block with this name already exists
         """
-        # Convert name to uppercase for storage (case-insensitive lookups)
-        upper_name = name.upper()
+        # Convert name to uppercase for storage (case-insensitive lookups). The key
+        # is interned so it is the same object as the new element's name.
+        upper_name = sys.intern(name.upper())
 
         # Check if list block already exists
         if upper_name in self._list_blocks:
@@ -714,10 +1122,7 @@ class DirectoryDocument(Document):
         self._list_blocks[upper_name] = external_list_block
 
         # Add to order tracking at specified position
-        if position == -1:
-            self._ordered_elements.append(external_list_block)
-        else:
-            self._ordered_elements.insert(position, external_list_block)
+        self._insert_element(external_list_block, position)
 
         # Mark document as dirty
         self._mark_dirty()
@@ -748,78 +1153,90 @@ class DirectoryDocument(Document):
         """
         return self._add_external_list_block(name, position=-1)
 
-    def save_to(self, directory: str):
+    def save_to(self, directory: str, _parallel: bool = True):
         """
         Save this directory document to a directory.
 
         Saves both _metadata.ozdf and all .ozdp data part files.
-        Uses backup/recovery mechanism to ensure data integrity.
+
+        The new contents are written to a sibling '<name>.ozdf_new' directory
+        and then swapped in with two directory renames, instead of moving every
+        existing file into a backup folder one at a time. While a save is in
+        progress, every directory that doesn't hold a complete, current copy
+        contains a .ozdf_writing marker, so an interrupted save is detected
+        when the corpus is next opened.
+
+        Does nothing if the document is not dirty and was last saved to the same directory.
 
         Note: Does not clear the dirty flag - that is the caller's responsibility.
 
         Args:
             directory: The directory where the document should be saved
+            _parallel: Internal. If False, write the .ozdp files serially
         """
+        # Nothing to do if the document is unchanged since it was last saved here
+        if self._is_saved_in(directory):
+            return
+
         # Ensure parent directory exists
         os.makedirs(directory, exist_ok=True)
 
-        # Construct the directory path for this document
+        # Construct the directory paths for this document
         doc_directory = os.path.join(directory, self.filename)
-        os.makedirs(doc_directory, exist_ok=True)
+        new_directory = doc_directory + '.ozdf_new'
+        old_directory = doc_directory + '.ozdf_old'
 
-        # Define special file/folder names
-        writing_marker = os.path.join(doc_directory, '.ozdf_writing')
-        backup_dir = os.path.join(doc_directory, '.ozdf_backup')
+        # Step 1: Remove leftovers of a previously interrupted save. The
+        # document is about to be written in full from memory, so they are not needed.
+        _remove_document_directory(new_directory)
+        _remove_document_directory(old_directory)
 
-        # Step 1: Create .ozdf_writing marker file
-        with open(writing_marker, 'w') as f:
+        # Step 2: Create the new directory with a .ozdf_writing marker file
+        os.makedirs(new_directory)
+        with open(os.path.join(new_directory, '.ozdf_writing'), 'w') as f:
             f.write('')  # Empty marker file
 
-        # Step 2: Create .ozdf_backup subfolder
-        os.makedirs(backup_dir, exist_ok=True)
-
-        # Step 3: Find all files to back up
-        backup_files = []
-        for item in os.listdir(doc_directory):
-            item_path = os.path.join(doc_directory, item)
-            # Skip the marker and backup directory itself
-            if item in ('.ozdf_writing', '.ozdf_backup'):
-                continue
-            # Record file for backup
-            if os.path.isfile(item_path):
-                backup_files.append(item)
-
-        # Step 4: Move all existing files into .ozdf_backup/
-        for item in backup_files:
-            src_path = os.path.join(doc_directory, item)
-            backup_path = os.path.join(backup_dir, item)
-            shutil.move(src_path, backup_path)
-
-        # Step 5: Write all new files
-        # Write _metadata.ozdf
-        metadata_path = os.path.join(doc_directory, '_metadata.ozdf')
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            for element in self._ordered_elements:
-                element._serialize_to(f)
-
-        # Write data parts for each external list block
-        for element in self._ordered_elements:
+        # Step 3: Write all new files
+        # _metadata.ozdf
+        payloads: List[Tuple[str, str]] = [(os.path.join(new_directory, '_metadata.ozdf'), self._serialize())]
+
+        # Data parts for each external list block. If the last save went to
+        # this same directory, unchanged data parts are linked from there.
+        previous_directory = doc_directory if self._saved_directory == os.path.abspath(directory) else None
+        saved_files: List[Tuple[ExternalListBlock, Dict[ListItem, Tuple[str, List[str]]]]] = []
+        for element in self._ordered_elements.values():
             if isinstance(element, ExternalListBlock):
-                element._save_data_parts_to(doc_directory)
+                saved_files.append((element, element._prepare_data_parts(new_directory, payloads, previous_directory)))
+
+        # Write the metadata and all data part files of every block together
+        _write_text_files(payloads, _parallel)
 
-        # Step 6: Delete .ozdf_writing marker
-        os.remove(writing_marker)
+        # Step 4: Mark the existing directory as superseded and move it aside
+        if os.path.isdir(doc_directory):
+            with open(os.path.join(doc_directory, '.ozdf_writing'), 'w') as f:
+                f.write('')  # Empty marker file
+            os.rename(doc_directory, old_directory)
 
-        # Step 7: Delete backup files explicitly, then delete .ozdf_backup/ folder
-        for backup_file in backup_files:
-            backup_path = os.path.join(backup_dir, backup_file)
-            os.remove(backup_path)
-        os.rmdir(backup_dir)
+        # Step 5: Move the new directory into place and delete its .ozdf_writing marker
+        os.rename(new_directory, doc_directory)
+        os.remove(os.path.join(doc_directory, '.ozdf_writing'))
+
+        # Step 6: Delete the old directory
+        _remove_document_directory(old_directory)
+        self._saved_directory = os.path.abspath(directory)
+
+        # Record which file holds each data part, now that the save is complete
+        for element, element_saved_files in saved_files:
+            element._saved_files = element_saved_files
+            for list_item in element_saved_files:
+                list_item._dirty = False
 
 
 class Corpus:
     """A collection of documents. Supports iteration and filtering. Acts as a context manager."""
 
+    __slots__ = ('_entries', 'save_path', '_lazy_documents')
+
     def __init__(self, save_path: Optional[str] = None):
         """
         Initialize a Corpus.
@@ -827,8 +1244,21 @@ class Corpus:
         Args:
             save_path: Optional path where corpus can be saved (None = no save capability)
         """
-        self.documents: List[Document] = []
+        self._entries: List[Optional[Document]] = []  # None for documents not yet loaded
         self.save_path = save_path
+        self._lazy_documents: Dict[int, Tuple[str, Callable[[], Document]]] = {}  # Maps index to (filename, loader)
+
+    @property
+    def documents(self) -> List[Document]:
+        """The list of documents (loads any documents not loaded yet)."""
+        for index in sorted(self._lazy_documents):
+            self._get_document_at(index)
+        return self._entries
+
+    @documents.setter
+    def documents(self, documents: List[Document]):
+        self._lazy_documents = {}
+        self._entries = documents
 
     def _add_existing_document(self, document: Document):
         """
@@ -837,7 +1267,59 @@ class Corpus:
         Args:
             document: The Document object to add
         """
-        self.documents.append(document)
+        self._entries.append(document)
+
+    def _add_lazy_document(self, filename: str, loader: Callable[[], Document]):
+        """
+        Internal method to add a document that is only loaded on first access.
+
+        Args:
+            filename: The document's filename (as returned by Document.filename)
+            loader: Callable that parses and returns the Document
+        """
+        self._lazy_documents[len(self._entries)] = (filename, loader)
+        self._entries.append(None)
+
+    def _get_document_at(self, index: int) -> Document:
+        """
+        Internal method to get the document at an index, loading it if needed.
+
+        Args:
+            index: The document index
+
+        Returns:
+            The Document object
+        """
+        document = self._entries[index]
+        if document is None:
+            filename, loader = self._lazy_documents.pop(index)
+            document = loader()
+            self._entries[index] = document
+        return document
+
+    def get_document(self, filename: str) -> Document:
+        """
+        Get a document by filename.
+
+        Only the requested document is loaded if the corpus was opened lazily.
+
+        Args:
+            filename: The document filename (e.g., 'my_doc.ozdf')
+
+        Returns:
+            The Document object
+
+        Raises:
+            KeyError: If no document with the given filename exists
+        """
+        for index, document in enumerate(self._entries):
+            if document is None:
+                document_filename = self._lazy_documents[index][0]
+            else:
+                document_filename = document.filename
+            if document_filename == filename:
+                return self._get_document_at(index)
+        raise KeyError(f"Document '{filename}' not found in corpus")
 
     def add_document(self, filename: str) -> Document:
         """
@@ -850,7 +1332,7 @@ class Corpus:
             The newly created Document object
         """
         document = Document(filename)
-        self.documents.append(document)
+        self._entries.append(document)
         return document
 
     def add_directory_document(self, dirname: str) -> DirectoryDocument:
@@ -864,16 +1346,17 @@ class Corpus:
             The newly created DirectoryDocument object
         """
         document = DirectoryDocument(dirname)
-        self.documents.append(document)
+        self._entries.append(document)
         return document
 
     def __iter__(self) -> Iterator[Document]:
-        """Iterate over documents."""
-        return iter(self.documents)
+        """Iterate over documents, loading any not yet loaded documents as they are reached."""
+        for index in range(len(self._entries)):
+            yield self._get_document_at(index)
 
     def __len__(self) -> int:
         """Return the number of documents."""
-        return len(self.documents)
+        return len(self._entries)
 
     # Note: __enter__ and __exit__ are excluded from cheatsheet
     def __enter__(self) -> 'Corpus':
@@ -899,9 +1382,45 @@ class Corpus:
         if self.save_path is None:
             raise RuntimeError("Cannot save corpus opened in read-only mode")
 
-        # Save all dirty documents
-        for document in self.documents:
-            if document._dirty:
-                document.save_to(self.save_path)
-                # Clear dirty flag after successful save
-                document._dirty = False
+        # Collect all dirty documents (documents that were never loaded can't have been modified)
+        dirty_documents = [document for document in self._entries if document is not None and document._dirty]
+
+        # Documents with the same filename write to the same paths, so they are
+        # saved one after another, in corpus order (the last one wins)
+        groups: Dict[str, List[Document]] = {}
+        for document in dirty_documents:
+            groups.setdefault(document.filename, []).append(document)
+
+        if len(groups) <= 1:
+            self._save_documents(dirty_documents)
+            return
+
+        # Each group is written to its own file or directory, so groups are
+        # saved concurrently. Serialization holds the GIL, but the file
+        # writes, renames and directory operations of different documents overlap.
+        # Each document's own files are then written serially rather than on a
+        # nested pool per document.
+        with ThreadPoolExecutor(max_workers=min(_WRITE_WORKERS, len(groups))) as executor:
+            futures = [executor.submit(self._save_documents, group, parallel=False) for group in groups.values()]
+
+        # Report the first failure once every group has finished
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+
+    def _save_documents(self, documents: List[Document], parallel: bool = True):
+        """
+        Internal method to save documents one after another, clearing the dirty flag of each one saved.
+
+        Stops at the first document that fails to save, leaving it and the
+        rest of the documents dirty.
+
+        Args:
+            documents: The documents to save, in order
+            parallel: If False, write each document's files serially
+        """
+        for document in documents:
+            document.save_to(self.save_path, _parallel=parallel)
+            # Clear dirty flag after successful save
+            document._dirty = False
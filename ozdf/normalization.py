@@ -8,8 +8,10 @@ This module handles:
 """
 
 import re
-import textwrap
-from typing import List
+from typing import Callable, List
+
+# Precompiled pattern (skips the re module's pattern cache lookup on every call)
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
 
 
 def normalize_paragraphs(paragraphs: List[str]) -> List[str]:
@@ -40,9 +42,16 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text
     """
-    text = text.strip()
-    text = re.sub(r'\s+', ' ', text)
-    return text
+    # Fast path for text that is already normalized (e.g. paragraphs read back
+    # from a file). Every whitespace character other than the plain space is
+    # non-printable, so isprintable() rules out tabs, newlines and Unicode
+    # spaces in one C-level scan; what's left is doubled or edge spaces.
+    if text.isprintable() and '  ' not in text and text[:1] != ' ' and text[-1:] != ' ':
+        return text
+
+    # str.split() with no arguments splits on runs of the same whitespace
+    # characters as \s and drops leading/trailing whitespace, all in C
+    return ' '.join(text.split())
 
 
 def split_into_paragraphs(text: str) -> List[str]:
@@ -56,19 +65,83 @@ def split_into_paragraphs(text: str) -> List[str]:
         List of paragraph strings (stripped, with empty paragraphs removed)
     """
     # Split on blank lines (lines with only whitespace)
-    paragraphs = re.split(r'\n\s*\n', text)
+    paragraphs = _PARAGRAPH_BREAK_RE.split(text)
 
     # Strip each paragraph, then filter out empty ones
     stripped_paragraphs = [p.strip() for p in paragraphs]
     return [p for p in stripped_paragraphs if p]
 
 
+def split_and_normalize(text: str) -> List[str]:
+    """
+    Split text into paragraphs and normalize each one in a single pass.
+
+    Equivalent to normalize_paragraphs(split_into_paragraphs(text)), but walks
+    the text once line by line instead of running a regex split followed by a
+    whitespace collapse per paragraph.
+
+    Args:
+        text: The raw text to split and normalize
+
+    Returns:
+        List of normalized, non-empty paragraph strings
+    """
+    paragraphs: List[str] = []
+    words: List[str] = []
+    for line in text.split('\n'):
+        line_words = line.split()
+        if line_words:
+            words.extend(line_words)
+        elif words:
+            # A blank (whitespace-only) line ends the current paragraph
+            paragraphs.append(' '.join(words))
+            words = []
+    if words:
+        paragraphs.append(' '.join(words))
+    return paragraphs
+
+
+def write_wrapped(text: str, write: Callable[[str], None]) -> None:
+    """
+    Wrap text to 80 characters per line and pass it to a write callable.
+
+    Each wrapped line and each newline between lines is passed to write()
+    as it is produced, so serializers can stream a paragraph straight into
+    their output (e.g. parts.append or file.write) without building the
+    wrapped paragraph as an intermediate string. No trailing newline is
+    written.
+
+    Args:
+        text: The text to wrap (single paragraph)
+        write: Callable receiving the output pieces in order
+    """
+    # Greedy line packing: add words to the current line while they fit
+    line_words: List[str] = []
+    line_length = 0
+    for word in text.split():
+        if line_words and line_length + 1 + len(word) <= 80:
+            line_words.append(word)
+            line_length += 1 + len(word)
+        else:
+            if line_words:
+                write(' '.join(line_words))
+                write('\n')
+            # A word longer than 80 characters ends up alone on its line
+            line_words = [word]
+            line_length = len(word)
+    if line_words:
+        write(' '.join(line_words))
+
+
 def wrap_to_80_chars(text: str) -> str:
     """
     Wrap text to 80 characters per line, preserving word boundaries.
 
     Lines are wrapped at spaces to avoid breaking words. If a word is longer
-    than 80 characters with no spaces, it will not be broken.
+    than 80 characters with no spaces, it will not be broken. Produces the
+    same result as textwrap.fill(text, width=80, break_long_words=False,
+    break_on_hyphens=False) for normalized text, without textwrap's general
+    purpose chunking machinery.
 
     Args:
         text: The text to wrap (single paragraph)
@@ -76,9 +149,6 @@ def wrap_to_80_chars(text: str) -> str:
     Returns:
         The wrapped text with newlines inserted at appropriate positions
     """
-    return textwrap.fill(
-        text,
-        width=80,
-        break_long_words=False,
-        break_on_hyphens=False
-    )
+    pieces: List[str] = []
+    write_wrapped(text, pieces.append)
+    return ''.join(pieces)
@@ -7,12 +7,63 @@ This module handles parsing of:
 - .ozdp data part files
 """
 
+import io
 import os
 import re
-import glob
-from typing import Tuple, List, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Tuple, List, Dict, Iterable, Optional, Union
 from ozdf.models import Document, DirectoryDocument, Block, ListBlock, ListItem, Comment, ExternalListBlock
 
+# Three-character prefixes that are only allowed as part of a header
+_RESERVED_PREFIXES = frozenset(('###', '==='))
+
+# Classifies a line starting with '#' or '=' in one match: a block header, a
+# list item header, or a reserved prefix that isn't a valid header.
+# match.lastgroup names the kind (None if the line is ordinary content).
+_HEADER_RE = re.compile(r'#### (?P<block>.*)|(?P<list_item>====(?: .*)?)$|(?P<invalid>###|===)')
+
+# External list blocks with more data parts than this parse them on a thread pool
+_PARALLEL_PARSE_THRESHOLD = 8
+
+# Thread pool size used for parsing (parsing is mostly file I/O)
+_PARSE_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+def _split_lines(data: str) -> List[str]:
+    """
+    Split file contents into lines without their line terminators.
+
+    Gives the same lines as iterating the file in text mode (minus the
+    trailing newlines). Only '\\n' is a line break here, unlike
+    str.splitlines() which also breaks on form feeds, \\u2028 and others.
+
+    Args:
+        data: The file contents, with newlines already translated to '\\n'
+
+    Returns:
+        List of lines
+    """
+    lines = data.split('\n')
+    # A trailing newline (or an empty file) leaves an empty string at the end
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _read_lines(file_path: str) -> List[str]:
+    """
+    Read a UTF-8 text file in one call and split it into lines.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        List of lines without line terminators
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return _split_lines(f.read())
+
 
 class _TextBuilder:
     """Helper class to accumulate lines and build text content for a block, list item, or comment."""
@@ -25,7 +76,7 @@ class _TextBuilder:
             target: The Block, ListItem, or Comment object to populate
         """
         self.target = target
-        self.lines: List[str] = []
+        self.buffer = io.StringIO()
 
     def append(self, line: str):
         """
@@ -34,24 +85,30 @@ class _TextBuilder:
         Args:
             line: A line of text from the file
         """
-        self.lines.append(line)
+        self.buffer.write(line)
+        self.buffer.write('\n')
 
     def apply(self):
         """
-        Process the accumulated lines and call set_text() on the target.
+        Process the accumulated lines and set them as the target's text.
         """
-        # Join all lines
-        text = '\n'.join(self.lines)
-        # Call set_text on the target (Block or ListItem)
-        self.target.set_text(text)
+        # Drop the newline written after the last line. Only that one newline
+        # is removed, so trailing blank lines are kept (comments preserve them).
+        text = self.buffer.getvalue()[:-1]
+        # Paragraph splitting and normalization are deferred until the text is used
+        self.target._set_raw_text(text)
 
 
-def parse_document(file_path: str) -> Document:
+def parse_document(file_path: str, lazy: bool = False, _parallel: bool = True) -> Document:
     """
     Parse a .ozdf document file or directory document.
 
     Args:
         file_path: Path to the .ozdf file or directory
+        lazy: If True, the .ozdp data parts of external list blocks are only
+            parsed when their list items are first accessed
+        _parallel: Internal. If False, .ozdp data parts are always parsed serially
+            (for callers that already parse several documents on a thread pool)
 
     Returns:
         A Document object
@@ -60,10 +117,14 @@ def parse_document(file_path: str) -> Document:
     is_directory = os.path.isdir(file_path)
 
     # Create document of appropriate type
+    directory_names: Optional[List[str]] = None
     if is_directory:
+        # List the directory once. The listing is used for the marker check
+        # below and shared by every external list block to find its .ozdp files.
+        directory_names = os.listdir(file_path)
+
         # Check if .ozdf_writing marker exists - this indicates a corrupted/incomplete write
-        writing_marker = os.path.join(file_path, '.ozdf_writing')
-        if os.path.exists(writing_marker):
+        if '.ozdf_writing' in directory_names:
             raise ValueError(f"Directory document '{file_path}' contains .ozdf_writing marker, indicating an incomplete or corrupted save operation")
         
         doc = DirectoryDocument(file_path)
@@ -76,99 +137,145 @@ def parse_document(file_path: str) -> Document:
     else:
         actual_file_path = file_path
 
-    with open(actual_file_path, 'r', encoding='utf-8') as f:
-        builder: Optional[_TextBuilder] = None
-        current_list_block: Optional[ListBlock] = None
-        prev_line_was_blank = False
-        blank_line_required = False  # First header doesn't need blank line before it
-
-        for line in f:
-            stripped = line.strip()
-
-            # Check if this is a block header
-            if stripped.startswith('#### '):
-                # Check for blank line requirement
-                if blank_line_required and not prev_line_was_blank:
-                    raise ValueError(f"Headers must be preceded by a blank line in '{file_path}'")
-
-                # Finish previous element
-                if builder:
-                    builder.apply()
-                    builder = None
-
-                header = stripped[5:].strip()  # Remove "#### " prefix
-
-                # Check if it's an external list block [[Name]]
-                if header.startswith('[[') and header.endswith(']]'):
-                    # External list blocks are only allowed in directory documents
-                    if not isinstance(doc, DirectoryDocument):
-                        raise ValueError(f"External list blocks [[Name]] are only allowed in directory documents, not in '{actual_file_path}'")
-
-                    list_name = header[2:-2]  # Extract name from double brackets
-                    # Create empty ExternalListBlock and populate it from .ozdp files
-                    external_list_block = doc.add_external_list_block_last(list_name)
-                    populate_external_list_block(file_path, external_list_block)
-                    current_list_block = None
-                    blank_line_required = True
-                # Check if it's a regular list block [Name]
-                elif header.startswith('[') and header.endswith(']'):
-                    list_name = header[1:-1]  # Extract name from brackets
-                    current_list_block = doc.add_list_block_last(list_name)
-                    blank_line_required = False  # First list item doesn't need blank line
-                elif header.upper() == 'COMMENT':
-                    current_list_block = None
-                    comment = doc._add_comment_last()
-                    builder = _TextBuilder(comment)
-                    blank_line_required = True
-                else:
-                    current_list_block = None
-                    block = doc.add_block_last(header)
-                    builder = _TextBuilder(block)
-                    blank_line_required = True
-
-            # we need to properly handle unnamed list items
-            elif stripped == '====' or stripped.startswith('==== '):
-                # Check if we're inside a list block
-                if current_list_block is None:
-                    raise ValueError(f"List item header found outside of list block in '{file_path}'")
-
-                # Check for blank line requirement
-                if blank_line_required and not prev_line_was_blank:
-                    raise ValueError(f"List item headers must be preceded by a blank line in '{file_path}'")
-
-                # This is a list item header
-                if builder:
-                    builder.apply()
-
-                item_name_part = stripped[5:].strip()  # Remove "==== " prefix
-                item_name = item_name_part if item_name_part else None
-
-                # Create list item and add to current list block
-                list_item = current_list_block.add_list_item(item_name)
-                builder = _TextBuilder(list_item)
-                blank_line_required = True  # Next list item DOES need blank line
-
-            elif stripped.startswith('###') or stripped.startswith('==='):
-                # Invalid line - starts with ### or === but not a valid header
-                raise ValueError(f"Invalid line in file '{file_path}': lines cannot start with '###' or '===' unless they are headers")
+    _parse_document_lines(doc, _read_lines(actual_file_path), file_path, actual_file_path, directory_names, lazy, _parallel)
+
+    return doc
 
-            else:
-                # This is content for the current element (or blank line)
-                if builder:
-                    builder.append(stripped)
-                elif stripped:  # Non-empty content before first header
-                    raise ValueError(f"Content found before first header in '{file_path}'")
 
-            # Update blank line tracking
-            prev_line_was_blank = (stripped == '')
+def parse_document_from_string(text: str, name: str = '<in-memory>') -> Document:
+    """
+    Parse the contents of a simple .ozdf document from a string.
+
+    No filesystem access is performed. External list blocks are not allowed,
+    since they need the .ozdp files of a directory document.
 
-        # Don't forget the last element
-        if builder:
-            builder.apply()
+    Args:
+        text: The document contents
+        name: The document filename, used for Document.filename and in error messages
 
+    Returns:
+        A Document object
+    """
+    doc = Document(name)
+    # Translate \r\n and \r like reading a file in text mode
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    _parse_document_lines(doc, _split_lines(text), name, name)
     return doc
 
 
+def _parse_document_lines(doc: Document, lines: Iterable[str], file_path: str, actual_file_path: str,
+                          directory_names: Optional[List[str]] = None, lazy: bool = False,
+                          parallel: bool = True):
+    """
+    Parse the lines of a .ozdf document or _metadata.ozdf file into a document.
+
+    Args:
+        doc: The Document (or DirectoryDocument) to populate
+        lines: The lines of the file, without line terminators
+        file_path: Path of the document (the directory for directory documents)
+        actual_file_path: Path of the file the lines were read from
+        directory_names: Listing of the document directory, if already read
+        lazy: If True, .ozdp data parts are parsed when their list items are first accessed
+        parallel: If False, .ozdp data parts are always parsed serially
+    """
+    builder: Optional[_TextBuilder] = None
+    current_list_block: Optional[ListBlock] = None
+    prev_line_was_blank = False
+    blank_line_required = False  # First header doesn't need blank line before it
+
+    for line in lines:
+        stripped = line.strip()
+        # Headers and reserved lines all start with '#' or '=', so content lines
+        # are told apart by their first character without running the regex
+        lead = stripped[:1]
+        header_kind = None
+        if lead == '#' or lead == '=':
+            header_match = _HEADER_RE.match(stripped)
+            if header_match:
+                header_kind = header_match.lastgroup
+
+        # Check if this is a block header
+        if header_kind == 'block':
+            # Check for blank line requirement
+            if blank_line_required and not prev_line_was_blank:
+                raise ValueError(f"Headers must be preceded by a blank line in '{file_path}'")
+
+            # Finish previous element
+            if builder:
+                builder.apply()
+                builder = None
+
+            header = stripped[5:].strip()  # Remove "#### " prefix
+
+            # Check if it's an external list block [[Name]]
+            if header.startswith('[[') and header.endswith(']]'):
+                # External list blocks are only allowed in directory documents
+                if not isinstance(doc, DirectoryDocument):
+                    raise ValueError(f"External list blocks [[Name]] are only allowed in directory documents, not in '{actual_file_path}'")
+
+                list_name = header[2:-2]  # Extract name from double brackets
+                # Create empty ExternalListBlock and populate it from .ozdp files
+                external_list_block = doc.add_external_list_block_last(list_name)
+                populate_external_list_block(file_path, external_list_block, directory_names, lazy, parallel)
+                current_list_block = None
+                blank_line_required = True
+            # Check if it's a regular list block [Name]
+            elif header.startswith('[') and header.endswith(']'):
+                list_name = header[1:-1]  # Extract name from brackets
+                current_list_block = doc.add_list_block_last(list_name)
+                blank_line_required = False  # First list item doesn't need blank line
+            elif header.upper() == 'COMMENT':
+                current_list_block = None
+                comment = doc._add_comment_last()
+                builder = _TextBuilder(comment)
+                blank_line_required = True
+            else:
+                current_list_block = None
+                block = doc.add_block_last(header)
+                builder = _TextBuilder(block)
+                blank_line_required = True
+
+        # we need to properly handle unnamed list items
+        elif header_kind == 'list_item':
+            # Check if we're inside a list block
+            if current_list_block is None:
+                raise ValueError(f"List item header found outside of list block in '{file_path}'")
+
+            # Check for blank line requirement
+            if blank_line_required and not prev_line_was_blank:
+                raise ValueError(f"List item headers must be preceded by a blank line in '{file_path}'")
+
+            # This is a list item header
+            if builder:
+                builder.apply()
+
+            item_name_part = stripped[5:].strip()  # Remove "==== " prefix
+            item_name = item_name_part if item_name_part else None
+
+            # Create list item and add to current list block
+            list_item = current_list_block.add_list_item(item_name)
+            builder = _TextBuilder(list_item)
+            blank_line_required = True  # Next list item DOES need blank line
+
+        elif header_kind == 'invalid':
+            # Invalid line - starts with ### or === but not a valid header
+            raise ValueError(f"Invalid line in file '{file_path}': lines cannot start with '###' or '===' unless they are headers")
+
+        else:
+            # This is content for the current element (or blank line)
+            if builder:
+                builder.append(stripped)
+            elif stripped:  # Non-empty content before first header
+                raise ValueError(f"Content found before first header in '{file_path}'")
+
+        # Update blank line tracking
+        prev_line_was_blank = (stripped == '')
+
+    # Don't forget the last element
+    if builder:
+        builder.apply()
+
+
 def parse_data_part_file(file_path: str) -> Document:
     """
     Parse a .ozdp data part file.
@@ -176,118 +283,198 @@ def parse_data_part_file(file_path: str) -> Document:
     Args:
         file_path: Path to the .ozdp file
 
+    Returns:
+        The data part document
+    """
+    return _parse_data_part_lines(_read_lines(file_path), file_path)
+
+
+def _parse_data_part_lines(lines: Iterable[str], file_path: str) -> Document:
+    """
+    Parse the lines of a .ozdp data part file.
+
+    Args:
+        lines: The lines of the file, without line terminators
+        file_path: Path of the .ozdp file (used for Document.filename and error messages)
+
     Returns:
         The data part document
     """
     doc = Document(file_path)
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        builder: Optional[_TextBuilder] = None
-        prev_line_was_blank = False
-        blank_line_required = False  # First header doesn't need blank line before it
-
-        for line in f:
-            stripped = line.strip()
-
-            # Check if this is a block header
-            if stripped.startswith('#### '):
-                # Check for blank line requirement
-                if blank_line_required and not prev_line_was_blank:
-                    raise ValueError(f"Headers must be preceded by a blank line in '{file_path}'")
-
-                # Finish previous element
-                if builder:
-                    builder.apply()
-                    builder = None
-
-                header = stripped[5:].strip()  # Remove "#### " prefix
-
-                # Check if it's a comment
-                if header.upper() == 'COMMENT':
-                    comment = doc._add_comment_last()
-                    builder = _TextBuilder(comment)
-                    blank_line_required = True
-                else:
-                    # Data part files contain simple blocks
-                    block = doc.add_block_last(header)
-                    builder = _TextBuilder(block)
-                    blank_line_required = True
-
-            elif stripped.startswith('###') or stripped.startswith('==='):
-                # Invalid line - starts with ### or === but not a valid header
-                raise ValueError(f"Invalid line in data part file '{file_path}': lines cannot start with '###' or '===' unless they are headers")
+    builder: Optional[_TextBuilder] = None
+    prev_line_was_blank = False
+    blank_line_required = False  # First header doesn't need blank line before it
+
+    for line in lines:
+        stripped = line.strip()
+
+        # Check if this is a block header
+        if stripped[:1] == '#' and stripped.startswith('#### '):
+            # Check for blank line requirement
+            if blank_line_required and not prev_line_was_blank:
+                raise ValueError(f"Headers must be preceded by a blank line in '{file_path}'")
+
+            # Finish previous element
+            if builder:
+                builder.apply()
+                builder = None
+
+            header = stripped[5:].strip()  # Remove "#### " prefix
 
+            # Check if it's a comment
+            if header.upper() == 'COMMENT':
+                comment = doc._add_comment_last()
+                builder = _TextBuilder(comment)
+                blank_line_required = True
             else:
-                # This is content for the current element (or blank line)
-                if builder:
-                    builder.append(stripped)
-                elif stripped:  # Non-empty content before first header
-                    raise ValueError(f"Content found before first header in '{file_path}'")
+                # Data part files contain simple blocks
+                block = doc.add_block_last(header)
+                builder = _TextBuilder(block)
+                blank_line_required = True
 
-            # Update blank line tracking
-            prev_line_was_blank = (stripped == '')
+        elif stripped[:3] in _RESERVED_PREFIXES:
+            # Invalid line - starts with ### or === but not a valid header
+            raise ValueError(f"Invalid line in data part file '{file_path}': lines cannot start with '###' or '===' unless they are headers")
 
-        # Don't forget the last element
-        if builder:
-            builder.apply()
+        else:
+            # This is content for the current element (or blank line)
+            if builder:
+                builder.append(stripped)
+            elif stripped:  # Non-empty content before first header
+                raise ValueError(f"Content found before first header in '{file_path}'")
+
+        # Update blank line tracking
+        prev_line_was_blank = (stripped == '')
+
+    # Don't forget the last element
+    if builder:
+        builder.apply()
 
     return doc
 
 
-def populate_external_list_block(dir_path: str, list_block: ExternalListBlock):
+def _parse_data_part_files(file_paths: List[str], parallel: bool = True) -> List[Document]:
+    """
+    Parse several .ozdp data part files.
+
+    Small batches are parsed serially. Larger ones are parsed on a thread
+    pool, so each file is read and parsed independently and the blocking
+    reads overlap with parsing of the files already loaded.
+
+    Args:
+        file_paths: Paths of the .ozdp files
+        parallel: If False, always parse serially (the caller is already
+            running on a thread pool, so a nested pool would only add threads)
+
+    Returns:
+        The data part documents, in the same order as file_paths
+    """
+    if not parallel or len(file_paths) <= _PARALLEL_PARSE_THRESHOLD:
+        return [parse_data_part_file(file_path) for file_path in file_paths]
+    with ThreadPoolExecutor(max_workers=min(_PARSE_WORKERS, len(file_paths))) as executor:
+        return list(executor.map(parse_data_part_file, file_paths))
+
+
+def populate_external_list_block(dir_path: str, list_block: ExternalListBlock,
+                                 directory_names: Optional[List[str]] = None, lazy: bool = False,
+                                 _parallel: bool = True):
     """
     Populate an external list block by scanning for and parsing its .ozdp files.
 
     Args:
         dir_path: Path to the directory containing the .ozdp files
         list_block: The ExternalListBlock to populate
+        directory_names: The names in dir_path, if already listed (listed here otherwise)
+        lazy: If True, only validate the filenames now and parse each file when its item is first accessed
+        _parallel: Internal. If False, parse the .ozdp files serially
 
     Raises:
         ValueError: If .ozdp files are missing required DATA block or have invalid format
     """
-    # Normalize the list block name for filenames (uppercase, spaces → underscores)
-    normalized_name = list_block.name.upper().replace(' ', '_')
+    # List block name as used in filenames (uppercase, spaces → underscores)
+    normalized_name = list_block._data_part_name
 
-    # Pattern to match files: {NORMALIZED_NAME}-{digits}.ozdp
-    pattern = f"{normalized_name}-*.ozdp"
+    # Match files named {NORMALIZED_NAME}-{digits}.ozdp with plain string
+    # tests on the directory listing (no glob or regex)
+    prefix = f"{normalized_name}-"
+    suffix = '.ozdp'
+    prefix_length = len(prefix)
+    suffix_length = len(suffix)
+
+    # Extract index from filename and create (index, filepath) tuples
+    if directory_names is None:
+        directory_names = os.listdir(dir_path)
+    indexed_files = []
+    for filename in directory_names:
+        if not (filename.startswith(prefix) and filename.endswith(suffix)):
+            continue
+        digits = filename[prefix_length:len(filename) - suffix_length]
+
+        # isdecimal() accepts exactly the characters matched by \d
+        if not digits.isdecimal():
+            raise ValueError(f"Invalid .ozdp filename format: '{filename}' (expected {normalized_name}-<digits>.ozdp)")
 
-    # Find all matching .ozdp files in the directory
-    file_pattern = os.path.join(dir_path, pattern)
-    matching_files = glob.glob(file_pattern)
+        indexed_files.append((int(digits), os.path.join(dir_path, filename)))
 
-    if not matching_files:
+    if not indexed_files:
         # No data parts found - this is valid, just means empty external list block
         return
 
-    # Extract index from filename and create (index, filepath) tuples
-    indexed_files = []
-    filename_pattern = re.compile(rf'^{re.escape(normalized_name)}-(\d+)\.ozdp$')
+    # Valid indexes are exactly 1..N, so each file can be placed directly in
+    # its slot instead of sorting. A slot that is out of range or already taken
+    # means the indexes aren't contiguous.
+    file_paths: List[str] = [''] * len(indexed_files)
+    contiguous = True
+    for index, file_path in indexed_files:
+        if not 1 <= index <= len(file_paths) or file_paths[index - 1]:
+            contiguous = False
+            break
+        file_paths[index - 1] = file_path
+
+    if not contiguous:
+        # Sort by index to report the first gap or duplicate, in index order
+        indexed_files.sort(key=lambda x: x[0])
+
+        # Validate indexes are contiguous starting from 1
+        for i, (index, file_path) in enumerate(indexed_files):
+            expected_index = i + 1
+            if index != expected_index:
+                filename = os.path.basename(file_path)
+                raise ValueError(f"Data part indexes must be contiguous starting from 1. Expected {expected_index}, got {index} in '{filename}'")
+
+    if lazy:
+        # Only the file list is kept; each item is parsed when first accessed
+        list_block._add_lazy_items(file_paths, partial(_load_data_part_items, list_block))
+    else:
+        list_block.items.extend(_load_data_part_items(list_block, file_paths, _parallel))
 
-    for file_path in matching_files:
-        filename = os.path.basename(file_path)
-        match = filename_pattern.match(filename)
 
-        if not match:
-            raise ValueError(f"Invalid .ozdp filename format: '{filename}' (expected {normalized_name}-<digits>.ozdp)")
+def _load_data_part_items(list_block: ExternalListBlock, file_paths: List[str],
+                          parallel: bool = True) -> List[ListItem]:
+    """
+    Parse .ozdp data part files into list items for an external list block.
 
-        index = int(match.group(1))
-        indexed_files.append((index, file_path))
+    The items are created with the list block's document as parent, but are
+    not added to the list block.
 
-    # Sort by index
-    indexed_files.sort(key=lambda x: x[0])
+    Args:
+        list_block: The ExternalListBlock the items belong to
+        file_paths: Paths of the .ozdp files, in item order
+        parallel: If False, parse the .ozdp files serially
 
-    # Validate indexes are contiguous starting from 1
-    for i, (index, file_path) in enumerate(indexed_files):
-        expected_index = i + 1
-        if index != expected_index:
-            filename = os.path.basename(file_path)
-            raise ValueError(f"Data part indexes must be contiguous starting from 1. Expected {expected_index}, got {index} in '{filename}'")
+    Returns:
+        The list items, in the same order as file_paths
 
-    # Process each file in order
-    for index, file_path in indexed_files:
-        # Parse the .ozdp file
-        data_part_doc = parse_data_part_file(file_path)
+    Raises:
+        ValueError: If a .ozdp file is missing the required DATA block
+    """
+    # Parse all .ozdp files up front (concurrently for large lists)
+    data_part_docs = _parse_data_part_files(file_paths, parallel)
 
+    # Build the list items in order
+    list_items: List[ListItem] = []
+    for file_path, data_part_doc in zip(file_paths, data_part_docs):
         # Extract NAME block if present (optional)
         item_name = None
         try:
@@ -303,8 +490,10 @@ def populate_external_list_block(dir_path: str, list_block: ExternalListBlock):
         except KeyError:
             raise ValueError(f"Data part file '{file_path}' missing required DATA block")
 
-        item_text = data_block.get_text()
+        # Create the list item. The DATA text is handed over unprocessed, so it
+        # is only split and normalized (once) if the item is actually read or saved.
+        list_item = ListItem(item_name, parent=list_block._parent)
+        list_item._set_raw_text(data_block._get_source_text())
+        list_items.append(list_item)
 
-        # Create list item and add to external list block
-        list_item = list_block.add_list_item(item_name)
-        list_item.set_text(item_text)
+    return list_items
@@ -3,6 +3,7 @@ Tests for 80-character line wrapping during serialization.
 """
 
 import ozdf
+from ozdf.normalization import wrap_to_80_chars
 
 
 def test_long_paragraph_wraps_at_80_chars(tmp_path):
@@ -96,3 +97,16 @@ def test_list_item_wraps_at_80_chars(tmp_path):
         # All content lines should be 80 characters or less
         for line in content_lines:
             assert len(line) <= 80, f"Line exceeds 80 chars: {len(line)} chars"
+
+
+def test_line_of_exactly_80_chars_is_not_wrapped():
+    """Test that a line of exactly 80 characters stays whole and one more word wraps."""
+    exact_80 = 'a' * 39 + ' ' + 'b' * 40
+    assert len(exact_80) == 80
+    assert wrap_to_80_chars(exact_80) == exact_80
+
+    # Adding one more word makes it wrap onto a new line
+    assert wrap_to_80_chars(exact_80 + ' c') == exact_80 + '\nc'
+
+    # Empty text stays empty
+    assert wrap_to_80_chars('') == ''
@@ -2,6 +2,8 @@
 Tests for reading OZDF corpus.
 """
 
+import os
+
 import ozdf
 
 
@@ -66,3 +68,41 @@ def test_corpus_iteration():
         count += 1
         assert isinstance(doc, ozdf.Document)
     assert count == 2
+
+
+def test_lazy_corpus(monkeypatch):
+    """Test that a lazily opened corpus only parses documents when they are accessed."""
+    parsed = []
+    parse_document = ozdf.io.parse_document
+
+    def counting_parse_document(file_path, **kwargs):
+        parsed.append(os.path.basename(file_path))
+        return parse_document(file_path, **kwargs)
+
+    monkeypatch.setattr(ozdf.io, 'parse_document', counting_parse_document)
+    c = ozdf.open_corpus_readonly('tests/fixtures/read_corpus/test_corpus1', lazy=True)
+
+    # Documents are known up front but not parsed yet
+    assert len(c) == 2
+    assert parsed == []
+
+    # Accessing one document by filename only loads that document
+    doc2 = c.get_document('test_document2.ozdf')
+    assert doc2.get_block('Title').get_text() == 'Doc 2'
+    assert parsed == ['test_document2.ozdf']
+
+    # Iteration loads the rest and returns the already-loaded document as-is
+    docs = list(c)
+    assert docs[0].get_block('Title').get_text() == 'Doc 1'
+    assert docs[1] is doc2
+    assert parsed == ['test_document2.ozdf', 'test_document1.ozdf']
+
+    # The documents list only ever holds loaded documents
+    assert c.documents == docs
+
+
+def test_lazy_corpus_documents_list():
+    """Test that reading the documents list of a lazy corpus loads every document."""
+    c = ozdf.open_corpus_readonly('tests/fixtures/read_corpus/test_corpus1', lazy=True)
+
+    assert [doc.get_block('Title').get_text() for doc in c.documents] == ['Doc 1', 'Doc 2']
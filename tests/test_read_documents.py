@@ -4,6 +4,7 @@ Tests for reading OZDF documents.
 
 import ozdf
 import pytest
+import shutil
 
 
 def test_read_simple_document():
@@ -98,3 +99,57 @@ def test_corpus_with_directory_document_with_only_writing_marker():
     # Attempting to open corpus should raise ValueError
     with pytest.raises(ValueError, match='contains .ozdf_writing marker'):
         ozdf.open_corpus_readonly('tests/fixtures/corpus_with_corrupted_document_only_writing_marker')
+
+
+def test_open_document_cached(tmp_path):
+    """Test that cached opens reuse the parsed document until the file changes."""
+    doc_path = tmp_path / 'cached.ozdf'
+    doc_path.write_text('#### Title\nFirst\n', encoding='utf-8')
+
+    doc1 = ozdf.open_document(str(doc_path), cached=True)
+    doc2 = ozdf.open_document(str(doc_path), cached=True)
+    assert doc1 is doc2
+    assert doc1.get_block('Title').get_text() == 'First'
+
+    # Uncached opens always parse a fresh document
+    assert ozdf.open_document(str(doc_path)) is not doc1
+
+    # A change to the file (different size) invalidates the cached entry
+    doc_path.write_text('#### Title\nSecond!\n', encoding='utf-8')
+    doc3 = ozdf.open_document(str(doc_path), cached=True)
+    assert doc3 is not doc1
+    assert doc3.get_block('Title').get_text() == 'Second!'
+
+
+def test_open_document_from_bytes():
+    """Test parsing a document from in-memory bytes matches parsing the file."""
+    with open('tests/fixtures/read_simple_document/simple.ozdf', 'rb') as f:
+        data = f.read()
+
+    doc = ozdf.open_document_from_bytes(data, 'simple.ozdf')
+    assert doc.filename == 'simple.ozdf'
+    assert doc.get_block("Title").get_text() == "Simple!"
+    assert len(doc.get_block("Paragraph Test")) == 3
+    assert doc.get_list_block("List Block Test")[0].get_name() == 'Named'
+
+    # External list blocks need a directory document on disk
+    with pytest.raises(ValueError, match='only allowed in directory documents'):
+        ozdf.open_document_from_bytes(b'#### [[Messages]]\n')
+
+
+def test_open_directory_document_lazy(tmp_path):
+    """Test that lazily opened directory documents parse each .ozdp file on first access."""
+    doc_dir = tmp_path / 'directory_doc'
+    shutil.copytree('tests/fixtures/read_directory_document/directory_doc', doc_dir)
+
+    doc = ozdf.open_document(str(doc_dir), lazy=True)
+    messages = doc.get_list_block('Messages')
+    assert len(messages) == 3
+    assert messages[0].get_name() == 'Alice'
+
+    # Data parts that haven't been accessed yet are read when they are first accessed
+    (doc_dir / 'MESSAGES-03.ozdp').write_text('#### NAME\nDave\n\n#### DATA\nHello from Dave!\n\n', encoding='utf-8')
+    assert messages[-1].get_name() == 'Dave'
+    assert messages[-1].get_text() == 'Hello from Dave!'
+    assert [item.get_name() for item in messages] == ['Alice', 'Bob', 'Dave']
+    assert messages[1][0] == 'Hello from Bob!'
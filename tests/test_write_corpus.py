@@ -106,3 +106,60 @@ def test_modify_existing_corpus(tmp_path):
     assert len(list_block2) == 2  # Original named item + new unnamed item
     assert list_block2[1].get_name() is None
     assert list_block2[1].get_text() == "Why, hello there! I'm a new addition to this family."
+
+
+def test_clean_document_save_is_skipped(tmp_path):
+    """Test that save_to skips a clean document only when saving to the directory it was last saved to."""
+    doc = ozdf.Document('doc.ozdf')
+    doc.add_block_last('Title', 'Original')
+    doc.save_to(str(tmp_path / 'a'))
+    doc._dirty = False  # What Corpus.save does after a successful save
+
+    # Overwrite the file behind the document's back; a clean re-save must not touch it
+    file_path = tmp_path / 'a' / 'doc.ozdf'
+    file_path.write_text('#### TITLE\nExternal\n', encoding='utf-8')
+    doc.save_to(str(tmp_path / 'a'))
+    assert ozdf.open_document(str(file_path)).get_block('Title').get_text() == 'External'
+
+    # Saving a clean document somewhere else still writes it
+    doc.save_to(str(tmp_path / 'b'))
+    assert ozdf.open_document(str(tmp_path / 'b' / 'doc.ozdf')).get_block('Title').get_text() == 'Original'
+
+    # Any modification makes the next save write again
+    doc.get_block('Title').set_text('Changed')
+    doc.save_to(str(tmp_path / 'a'))
+    assert ozdf.open_document(str(file_path)).get_block('Title').get_text() == 'Changed'
+
+
+def test_add_list_items(tmp_path):
+    """Test adding several list items to a list block at once."""
+
+    output_path = tmp_path / "corpus1"
+
+    with ozdf.open_corpus_writeonly(str(output_path)) as corpus:
+        doc = corpus.add_document('new_document.ozdf')
+        list_block = doc.add_list_block_last('Tasks')
+        list_block.add_list_item('First Task', 'Do the first thing.')
+        new_items = list_block.add_list_items([('Second Task', 'Do the second thing.'), (None, 'An unnamed task.')])
+
+        assert [item.get_name() for item in new_items] == ['Second Task', None]
+        assert list(list_block)[1:] == new_items
+
+    saved_doc = list(ozdf.open_corpus_readonly(str(output_path)))[0]
+    saved_tasks = saved_doc.get_list_block('Tasks')
+    assert [item.get_name() for item in saved_tasks] == ['First Task', 'Second Task', None]
+    assert [item.get_text() for item in saved_tasks] == ['Do the first thing.', 'Do the second thing.', 'An unnamed task.']
+
+
+def test_save_documents_with_same_filename(tmp_path):
+    """Test that documents sharing a filename are saved in order, with the last one winning."""
+    corpus_path = tmp_path / 'corpus'
+    with ozdf.open_corpus_writeonly(str(corpus_path)) as corpus:
+        for index in range(20):
+            doc = corpus.add_directory_document('doc')
+            doc.add_external_list_block_last('Items').add_list_item('Item', f'Version {index}')
+        corpus.add_document('other.ozdf').add_block_last('Title', 'Other')
+
+    assert sorted(path.name for path in corpus_path.iterdir()) == ['doc', 'other.ozdf']
+    saved = ozdf.open_corpus_readonly(str(corpus_path))
+    assert saved.get_document('doc').get_list_block('Items')[0].get_text() == 'Version 19'
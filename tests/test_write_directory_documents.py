@@ -207,3 +207,83 @@ def test_index_padding(tmp_path):
 
     saved_doc2 = ozdf.open_document(str(tmp_path / 'test_doc_3digits'))
     assert len(saved_doc2.get_list_block('Messages')) == 100
+
+
+def test_large_external_list_block_round_trip(tmp_path):
+    """Test that an external list block with many data parts reloads in index order."""
+
+    doc = DirectoryDocument('test_doc')
+    messages = doc.add_external_list_block_last('Messages')
+    for i in range(25):
+        # Alternate named and unnamed items
+        messages.add_list_item(f'Item {i}' if i % 2 else None, f'Message number {i}')
+
+    doc.save_to(str(tmp_path))
+
+    saved_messages = ozdf.open_document(str(tmp_path / 'test_doc')).get_list_block('Messages')
+    assert len(saved_messages) == 25
+    for i in range(25):
+        assert saved_messages[i].get_name() == (f'Item {i}' if i % 2 else None)
+        assert saved_messages[i].get_text() == f'Message number {i}'
+
+
+def test_resave_only_rewrites_changed_data_parts(tmp_path):
+    """Test that saving again to the same directory reuses unchanged .ozdp files."""
+
+    doc = DirectoryDocument('test_doc')
+    doc.add_block_last('Title', 'First title')
+    messages = doc.add_external_list_block_last('Messages')
+    alice = messages.add_list_item('Alice', 'Hello from Alice')
+    bob = messages.add_list_item('Bob', 'Hello from Bob')
+    carol = messages.add_list_item('Carol', 'Hello from Carol')
+    doc.save_to(str(tmp_path))
+
+    doc_dir = tmp_path / 'test_doc'
+    alice_inode = (doc_dir / 'MESSAGES-01.ozdp').stat().st_ino
+    dave = messages.add_list_item('Dave', 'Hello from Dave')
+    erin = messages.add_list_item('Erin', 'Hello from Erin')
+    doc.save_to(str(tmp_path))
+    erin.append('PS')
+    doc.save_to(str(tmp_path))
+
+    # Change the metadata and one item, edit another one directly, and swap the order of two
+    doc.get_block('Title').set_text('Second title')
+    bob.set_text('Bye from Bob')
+    carol.paragraphs[0] = 'Bye from Carol'
+    dave.name = 'David'
+    erin.paragraphs.pop()  # Back to the paragraphs of an earlier save, but not the last one
+    messages.set_list_items([alice, carol, bob, dave, erin])
+    doc.save_to(str(tmp_path))
+
+    # The untouched item's file was carried over rather than rewritten
+    assert (doc_dir / 'MESSAGES-01.ozdp').stat().st_ino == alice_inode
+
+    saved_doc = ozdf.open_document(str(doc_dir))
+    assert saved_doc.get_block('Title').get_text() == 'Second title'
+    saved_messages = saved_doc.get_list_block('Messages')
+    assert [item.get_name() for item in saved_messages] == ['Alice', 'Carol', 'Bob', 'David', 'Erin']
+    assert [item.get_text() for item in saved_messages] == ['Hello from Alice', 'Bye from Carol', 'Bye from Bob', 'Hello from Dave', 'Hello from Erin']
+    assert not (doc_dir.parent / 'test_doc.ozdf_old').exists()
+
+
+def test_failed_old_directory_removal_is_not_loaded_as_document(tmp_path, monkeypatch):
+    """Test that a superseded copy that can't be fully deleted is reported rather than loaded."""
+
+    doc = DirectoryDocument('test_doc')
+    doc.add_block_last('Title', 'First title')
+    doc.save_to(str(tmp_path))
+
+    def failing_rmtree(path, *args, **kwargs):
+        raise OSError(f"Cannot remove '{path}'")
+
+    monkeypatch.setattr(ozdf.models.shutil, 'rmtree', failing_rmtree)
+    doc.get_block('Title').set_text('Second title')
+    with pytest.raises(OSError):
+        doc.save_to(str(tmp_path))
+    monkeypatch.undo()
+
+    # The new copy is in place, and the leftover old copy only has its marker
+    assert ozdf.open_document(str(tmp_path / 'test_doc')).get_block('Title').get_text() == 'Second title'
+    assert sorted(path.name for path in (tmp_path / 'test_doc.ozdf_old').iterdir()) == ['.ozdf_writing']
+    with pytest.raises(ValueError, match='ozdf_writing'):
+        ozdf.open_corpus_readonly(str(tmp_path))